@@ -6,10 +6,42 @@ Generates a new project from the template by replacing template variables.
 
 import json
 import os
+import re
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Pattern
+
+# Directories skipped when applying template replacements
+SKIP_DIRS = frozenset(
+    {
+        '.git',
+        '__pycache__',
+        '.pytest_cache',
+        '.venv',
+        '.mypy_cache',
+        'htmlcov',
+    }
+)
+
+# Extensions of files that template replacements are applied to
+TEXT_SUFFIXES = frozenset(
+    {
+        '.py',
+        '.toml',
+        '.yaml',
+        '.yml',
+        '.json',
+        '.md',
+        '.txt',
+        '.sh',
+        '.conf',
+        '.cfg',
+        '.ini',
+    }
+)
 
 
 def load_template_config() -> Dict[str, Any]:
@@ -63,37 +95,80 @@ def get_user_config() -> Dict[str, Any]:
     return config
 
 
-def replace_in_file(file_path: Path, replacements: Dict[str, str]) -> None:
-    """Replace template variables in a file."""
-    try:
-        content = file_path.read_text(encoding='utf-8')
+def probe_keys(keys: Iterable[bytes]) -> List[bytes]:
+    """Return the keys that do not contain another key.
+
+    Any text containing one of ``keys`` also contains one of the returned
+    probes, so scanning for the probes alone tells whether a file matches.
+    """
+    keys = list(keys)
+    return [
+        key for key in keys if not any(other != key and other in key for other in keys)
+    ]
+
+
+def replace_in_file(
+    file_path: str,
+    pattern: Pattern[bytes],
+    replacements: Dict[bytes, bytes],
+    probes: Iterable[bytes],
+) -> bool:
+    """Replace template variables in a file.
 
-        for old, new in replacements.items():
-            content = content.replace(old, new)
+    Works on raw UTF-8 bytes: every occurrence matched by ``pattern`` is
+    substituted in a single pass with its value from ``replacements``. Files
+    that contain none of the ``probes`` (see probe_keys) are left untouched.
 
-        file_path.write_text(content, encoding='utf-8')
-        print(f"Updated {file_path}")
+    Returns whether the file was rewritten.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        if not any(probe in raw for probe in probes):
+            return False
+
+        with open(file_path, 'wb') as f:
+            f.write(pattern.sub(lambda match: replacements[match.group(0)], raw))
+        return True
 
-    except UnicodeDecodeError:
-        # Skip binary files
-        print(f"Skipped binary file {file_path}")
     except Exception as e:
         print(f"Error updating {file_path}: {e}")
+        return False
+
+
+def iter_files(path: str, dirs: Optional[List[str]] = None) -> Iterator[os.DirEntry]:
+    """Yield regular files below a directory, skipping SKIP_DIRS.
+
+    Uses os.scandir so file type checks come from the directory listing
+    instead of a stat call per entry. When ``dirs`` is given, the path of each
+    visited directory is appended to it, children before their parents.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    yield from iter_files(entry.path, dirs)
+                    if dirs is not None:
+                        dirs.append(entry.path)
+            elif entry.is_file():
+                yield entry
 
 
-def rename_directories(base_path: Path, old_name: str, new_name: str) -> None:
-    """Rename directories containing the old project name."""
-    for root, dirs, files in os.walk(base_path, topdown=False):
-        root_path = Path(root)
+def rename_directories(dir_paths: Iterable[str], old_name: str, new_name: str) -> None:
+    """Rename directories containing the old project name.
 
-        # Rename directories
-        for dir_name in dirs:
-            if old_name in dir_name:
-                old_dir = root_path / dir_name
-                new_dir = root_path / dir_name.replace(old_name, new_name)
-                if old_dir.exists() and not new_dir.exists():
-                    old_dir.rename(new_dir)
-                    print(f"Renamed directory: {old_dir} -> {new_dir}")
+    ``dir_paths`` must list children before their parents (as collected by
+    iter_files) so earlier renames never invalidate later paths.
+    """
+    for dir_path in dir_paths:
+        old_dir = Path(dir_path)
+        if old_name not in old_dir.name:
+            continue
+
+        new_dir = old_dir.with_name(old_dir.name.replace(old_name, new_name))
+        if old_dir.exists() and not new_dir.exists():
+            old_dir.rename(new_dir)
+            print(f"Renamed directory: {old_dir} -> {new_dir}")
 
 
 def generate_project(target_dir: str = None) -> None:
@@ -153,46 +228,51 @@ def generate_project(target_dir: str = None) -> None:
     print(f"\nApplying template transformations...")
     print(f"Replacements: {replacements}")
 
-    # Apply replacements to all text files
-    for root, dirs, files in os.walk(target_path):
-        # Skip certain directories
-        dirs[:] = [
-            d
-            for d in dirs
-            if d
-            not in {
-                '.git',
-                '__pycache__',
-                '.pytest_cache',
-                '.venv',
-                '.mypy_cache',
-                'htmlcov',
-            }
-        ]
-
-        for file in files:
-            file_path = Path(root) / file
-            if file_path.suffix in {
-                '.py',
-                '.toml',
-                '.yaml',
-                '.yml',
-                '.json',
-                '.md',
-                '.txt',
-                '.sh',
-                '.conf',
-                '.cfg',
-                '.ini',
-            }:
-                replace_in_file(file_path, replacements)
+    # Files are rewritten as bytes, so encode the mappings once up front
+    replacements_bytes = {
+        old.encode('utf-8'): new.encode('utf-8') for old, new in replacements.items()
+    }
+
+    # Match longest keys first so e.g. "Butler Team" wins over "Butler"
+    pattern = re.compile(
+        b'|'.join(
+            re.escape(old) for old in sorted(replacements_bytes, key=len, reverse=True)
+        )
+    )
+
+    # Keys like "Butler Team" contain "Butler", so only the latter is scanned for
+    probes = probe_keys(replacements_bytes)
+
+    # Apply replacements to all text files, noting directories for renaming
+    dir_paths: List[str] = []
+    file_paths = [
+        entry.path
+        for entry in iter_files(str(target_path), dir_paths)
+        if os.path.splitext(entry.name)[1] in TEXT_SUFFIXES
+    ]
+
+    # Files are independent and mostly I/O bound, so process them concurrently
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as pool:
+        updated = sum(
+            pool.map(
+                partial(
+                    replace_in_file,
+                    pattern=pattern,
+                    replacements=replacements_bytes,
+                    probes=probes,
+                ),
+                file_paths,
+            )
+        )
+
+    print(f"Updated {updated}/{len(file_paths)} files")
 
     # Rename directories
     old_project_name = template_config['project_name']
     new_project_name = user_config['project_name']
 
     if old_project_name != new_project_name:
-        rename_directories(target_path, old_project_name, new_project_name)
+        rename_directories(dir_paths, old_project_name, new_project_name)
 
     # Clean up template files
     template_files = [
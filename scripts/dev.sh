@@ -27,6 +27,8 @@ fi
 # Start the service with reload
 echo "Butler service is starting in development mode..."
 exec uvicorn butler.main:app \
+    --loop uvloop \
+    --http httptools \
     --host "${HOST:-127.0.0.1}" \
     --port "${PORT:-8000}" \
     --reload \
@@ -21,6 +21,8 @@ source .venv/bin/activate
 # Start the service
 echo "Butler service is starting..."
 exec uvicorn butler.main:app \
+    --loop uvloop \
+    --http httptools \
     --host "${HOST:-0.0.0.0}" \
     --port "${PORT:-8000}" \
     --workers "${WORKERS:-1}" \
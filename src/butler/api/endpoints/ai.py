@@ -1,30 +1,48 @@
 """AI service endpoints."""
 
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 
 from butler.api.endpoints.auth import User, get_current_user
 from butler.core.logging import get_logger
-from butler.services.ai_service import AIService
+from butler.services.ai_service import AIService, get_ai_service
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Server-sent events closing a chat stream
+STREAM_DONE_EVENT = b"data: [DONE]\n\n"
+STREAM_ERROR_EVENT = b'event: error\ndata: {"detail":"AI service unavailable"}\n\n'
+
 
 class ChatRequest(BaseModel):
     """Chat request model."""
 
+    model_config = ConfigDict(extra="forbid")
+
     message: str = Field(..., description="The user's message")
     provider: str = Field(
-        default="openai", description="AI provider (openai, anthropic, google)"
+        default="openai",
+        description="AI provider (openai, anthropic, google, or race for all)",
     )
     model: Optional[str] = Field(None, description="Specific model to use")
     max_tokens: Optional[int] = Field(None, description="Maximum tokens to generate")
     temperature: Optional[float] = Field(0.7, description="Temperature for generation")
 
 
+class ChatStreamRequest(ChatRequest):
+    """Streaming chat request model."""
+
+    provider: str = Field(
+        default="openai",
+        description="AI provider (openai, anthropic, or google; race does not stream)",
+    )
+
+
 class ChatResponse(BaseModel):
     """Chat response model."""
 
@@ -35,7 +53,11 @@ class ChatResponse(BaseModel):
 
 
 @router.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest, current_user: User = Depends(get_current_user)):
+async def chat(
+    request: ChatRequest,
+    current_user: User = Depends(get_current_user),
+    ai_service: AIService = Depends(get_ai_service),
+):
     """Chat with AI service."""
     logger.info(
         "AI chat request",
@@ -45,7 +67,6 @@ async def chat(request: ChatRequest, current_user: User = Depends(get_current_us
     )
 
     try:
-        ai_service = AIService()
         response = await ai_service.chat(
             message=request.message,
             provider=request.provider,
@@ -61,7 +82,8 @@ async def chat(request: ChatRequest, current_user: User = Depends(get_current_us
             tokens_used=response.get("usage", {}).get("total_tokens", 0),
         )
 
-        return ChatResponse(**response)
+        # Validated once by the route's response_model
+        return response
 
     except ValueError as e:
         logger.error("Invalid AI provider", provider=request.provider, error=str(e))
@@ -77,10 +99,56 @@ async def chat(request: ChatRequest, current_user: User = Depends(get_current_us
         raise HTTPException(status_code=500, detail="AI service unavailable")
 
 
+@router.post("/chat/stream")
+async def chat_stream(
+    request: ChatStreamRequest,
+    current_user: User = Depends(get_current_user),
+    ai_service: AIService = Depends(get_ai_service),
+):
+    """Stream a chat reply from the AI service as server-sent events."""
+    logger.info(
+        "AI chat stream request",
+        user_id=current_user.id,
+        provider=request.provider,
+        model=request.model,
+    )
+
+    try:
+        chunks = ai_service.chat_stream(
+            message=request.message,
+            provider=request.provider,
+            model=request.model,
+            max_tokens=request.max_tokens,
+            temperature=request.temperature,
+        )
+    except ValueError as e:
+        logger.error("Invalid AI provider", provider=request.provider, error=str(e))
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def events() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in chunks:
+                yield b"data: " + orjson.dumps({"content": chunk}) + b"\n\n"
+        except Exception as e:
+            # Headers are already sent, so report the failure in-band
+            logger.error(
+                "AI service error",
+                user_id=current_user.id,
+                provider=request.provider,
+                error=str(e),
+            )
+            yield STREAM_ERROR_EVENT
+            return
+        yield STREAM_DONE_EVENT
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.get("/providers")
-async def get_available_providers(current_user: User = Depends(get_current_user)):
+async def get_available_providers(
+    current_user: User = Depends(get_current_user),
+    ai_service: AIService = Depends(get_ai_service),
+):
     """Get available AI providers and their status."""
-    ai_service = AIService()
-    providers = await ai_service.get_available_providers()
-
-    return {"providers": providers}
+    # The provider list is fixed per service, so its JSON body is prebuilt
+    return Response(content=ai_service.providers_body, media_type="application/json")
@@ -1,13 +1,15 @@
 """Authentication endpoints."""
 
+import hashlib
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Annotated, Any, Dict, Optional, Tuple
 
+import jwt
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
 from passlib.context import CryptContext
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, StringConstraints
 
 from butler.core.config import settings
 from butler.core.logging import get_logger
@@ -19,11 +21,31 @@ logger = get_logger(__name__)
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
+# Token settings are fixed for the life of the process
+JWT_SECRET_KEY = settings.secret_key
+JWT_ALGORITHM = settings.algorithm
+JWT_ALGORITHMS = [JWT_ALGORITHM]
+ACCESS_TOKEN_EXPIRE = timedelta(minutes=settings.access_token_expire_minutes)
+ACCESS_TOKEN_EXPIRE_SECONDS = settings.access_token_expire_minutes * 60
+
+# Password hashes keyed by a digest of the password, never the plaintext
+PASSWORD_HASH_CACHE_SIZE = 1024
+_password_hash_cache: Dict[bytes, str] = {}
+
+# Decoded token payloads and their expiry, keyed by a digest of the token
+TOKEN_CACHE_SIZE = 4096
+_token_cache: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
+
+# Basic shape check for client-supplied emails, without email-validator
+Email = Annotated[
+    str, StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=254)
+]
+
 
 class UserCreate(BaseModel):
     """User creation model."""
 
-    email: EmailStr
+    email: Email
     password: str
     full_name: Optional[str] = None
 
@@ -31,7 +53,7 @@ class UserCreate(BaseModel):
 class UserLogin(BaseModel):
     """User login model."""
 
-    email: EmailStr
+    email: Email
     password: str
 
 
@@ -47,7 +69,7 @@ class User(BaseModel):
     """User model."""
 
     id: int
-    email: EmailStr
+    email: str
     full_name: Optional[str] = None
     is_active: bool = True
 
@@ -58,8 +80,24 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password."""
-    return pwd_context.hash(password)
+    """Hash a password.
+
+    When ``cache_password_hashes`` is enabled, repeated passwords reuse their
+    first bcrypt hash instead of paying for a fresh one.
+    """
+    if not settings.cache_password_hashes:
+        return pwd_context.hash(password)
+
+    key = hashlib.blake2b(password.encode(), digest_size=16).digest()
+    hashed_password = _password_hash_cache.get(key)
+    if hashed_password is None:
+        hashed_password = pwd_context.hash(password)
+        if len(_password_hash_cache) >= PASSWORD_HASH_CACHE_SIZE:
+            # Evict the oldest entry
+            del _password_hash_cache[next(iter(_password_hash_cache))]
+        _password_hash_cache[key] = hashed_password
+
+    return hashed_password
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -69,18 +107,39 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.access_token_expire_minutes
-        )
+        expire = datetime.utcnow() + ACCESS_TOKEN_EXPIRE
 
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.secret_key, algorithm=settings.algorithm
-    )
+    encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
 
     return encoded_jwt
 
 
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """Decode a JWT access token.
+
+    Payloads of previously verified tokens are served from a cache until the
+    token expires. Raises PyJWTError for invalid or expired tokens.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        expires_at, payload = cached
+        if expires_at > time.time():
+            return payload
+        del _token_cache[key]
+
+    payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=JWT_ALGORITHMS)
+
+    if "exp" in payload:
+        if len(_token_cache) >= TOKEN_CACHE_SIZE:
+            # Evict the oldest entry
+            del _token_cache[next(iter(_token_cache))]
+        _token_cache[key] = (float(payload["exp"]), payload)
+
+    return payload
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> User:
@@ -92,15 +151,11 @@ async def get_current_user(
     )
 
     try:
-        payload = jwt.decode(
-            credentials.credentials,
-            settings.secret_key,
-            algorithms=[settings.algorithm],
-        )
+        payload = decode_access_token(credentials.credentials)
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
-    except JWTError:
+    except jwt.PyJWTError:
         raise credentials_exception
 
     # In a real app, you would fetch the user from the database
@@ -124,14 +179,11 @@ async def register(user_data: UserCreate):
     logger.info("User registered successfully", email=user_data.email)
 
     # Create access token
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
     access_token = create_access_token(
-        data={"sub": user_data.email}, expires_delta=access_token_expires
+        data={"sub": user_data.email}, expires_delta=ACCESS_TOKEN_EXPIRE
     )
 
-    return Token(
-        access_token=access_token, expires_in=settings.access_token_expire_minutes * 60
-    )
+    return Token(access_token=access_token, expires_in=ACCESS_TOKEN_EXPIRE_SECONDS)
 
 
 @router.post("/login", response_model=Token)
@@ -148,14 +200,11 @@ async def login(user_data: UserLogin):
     logger.info("User logged in successfully", email=user_data.email)
 
     # Create access token
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
     access_token = create_access_token(
-        data={"sub": user_data.email}, expires_delta=access_token_expires
+        data={"sub": user_data.email}, expires_delta=ACCESS_TOKEN_EXPIRE
     )
 
-    return Token(
-        access_token=access_token, expires_in=settings.access_token_expire_minutes * 60
-    )
+    return Token(access_token=access_token, expires_in=ACCESS_TOKEN_EXPIRE_SECONDS)
 
 
 @router.get("/me", response_model=User)
@@ -167,11 +216,8 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
 @router.post("/refresh", response_model=Token)
 async def refresh_token(current_user: User = Depends(get_current_user)):
     """Refresh access token."""
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
     access_token = create_access_token(
-        data={"sub": current_user.email}, expires_delta=access_token_expires
+        data={"sub": current_user.email}, expires_delta=ACCESS_TOKEN_EXPIRE
     )
 
-    return Token(
-        access_token=access_token, expires_in=settings.access_token_expire_minutes * 60
-    )
+    return Token(access_token=access_token, expires_in=ACCESS_TOKEN_EXPIRE_SECONDS)
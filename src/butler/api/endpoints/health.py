@@ -1,12 +1,22 @@
 """Health check endpoints."""
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 from pydantic import BaseModel
 
 from butler.core.config import settings
 
 router = APIRouter()
 
+# The health payload never changes, so it is serialized once at import
+HEALTH_BODY = orjson.dumps(
+    {
+        "status": "healthy",
+        "service": settings.app_name,
+        "version": settings.app_version,
+    }
+)
+
 
 class HealthResponse(BaseModel):
     """Health check response model."""
@@ -17,13 +27,9 @@ class HealthResponse(BaseModel):
 
 
 @router.get("/", response_model=HealthResponse)
-async def health_check():
+async def health_check() -> Response:
     """Detailed health check endpoint."""
-    return HealthResponse(
-        status="healthy",
-        service=settings.app_name,
-        version=settings.app_version,
-    )
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/ready")
@@ -1,7 +1,8 @@
 """CLI interface for Butler service."""
 
 import asyncio
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import typer
 import uvicorn
@@ -9,7 +10,6 @@ from rich.console import Console
 from rich.table import Table
 
 from butler.core.config import settings
-from butler.core.logging import configure_logging, get_logger
 
 app = typer.Typer(name="butler", help="Butler - A Python backend service")
 console = Console()
@@ -36,18 +36,10 @@ def serve(
     )
 
 
-@app.command()
-def config():
-    """Show current configuration."""
-    configure_logging()
-
-    # Create a table to display configuration
-    table = Table(title="Butler Configuration")
-    table.add_column("Setting", style="cyan", no_wrap=True)
-    table.add_column("Value", style="magenta")
-
-    # Add configuration rows
-    config_items = [
+@lru_cache()
+def get_config_items() -> Tuple[Tuple[str, str], ...]:
+    """Get the configuration rows shown by the config command."""
+    return (
         ("App Name", settings.app_name),
         ("Version", settings.app_version),
         ("Debug", str(settings.debug)),
@@ -60,9 +52,18 @@ def config():
         ("OpenAI API Key", "Set" if settings.openai_api_key else "Not Set"),
         ("Anthropic API Key", "Set" if settings.anthropic_api_key else "Not Set"),
         ("Google AI API Key", "Set" if settings.google_ai_api_key else "Not Set"),
-    ]
+    )
+
+
+@app.command()
+def config():
+    """Show current configuration."""
+    # Create a table to display configuration
+    table = Table(title="Butler Configuration")
+    table.add_column("Setting", style="cyan", no_wrap=True)
+    table.add_column("Value", style="magenta")
 
-    for setting, value in config_items:
+    for setting, value in get_config_items():
         table.add_row(setting, value)
 
     console.print(table)
@@ -1,10 +1,10 @@
 """Configuration settings for Butler service."""
 
 from functools import lru_cache
-from typing import Any, Dict, Optional
+from typing import Annotated, Any, Dict, Optional
 
-from pydantic import Field, validator
-from pydantic_settings import BaseSettings
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode
 
 
 class Settings(BaseSettings):
@@ -39,17 +39,32 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
 
+    # Reuse bcrypt hashes for repeated passwords (load tests only: the cached
+    # hash shares its salt across users)
+    cache_password_hashes: bool = False
+
     # AI Service API Keys
     openai_api_key: Optional[str] = None
     anthropic_api_key: Optional[str] = None
     google_ai_api_key: Optional[str] = None
 
+    # OpenAI-compatible API root; point at a self-hosted vLLM/TGI server to use it
+    # as the openai provider
+    openai_base_url: str = "https://api.openai.com/v1"
+
+    # Number of chat responses cached for identical requests (0 disables)
+    ai_response_cache_size: int = 1024
+
     # Logging
     log_level: str = "INFO"
     log_format: str = "json"
 
     # CORS settings
-    allowed_origins: list[str] = ["http://localhost:3000", "http://localhost:8080"]
+    # Comma-separated in the environment, split once by parse_origins
+    allowed_origins: Annotated[list[str], NoDecode] = [
+        "http://localhost:3000",
+        "http://localhost:8080",
+    ]
     allowed_methods: list[str] = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
     allowed_headers: list[str] = ["*"]
 
@@ -58,10 +73,11 @@ class Settings(BaseSettings):
     rate_limit_requests: int = 100
     rate_limit_period: int = 60
 
-    @validator("allowed_origins", pre=True)
+    @field_validator("allowed_origins", mode="before")
+    @classmethod
     def parse_origins(cls, v: Any) -> list[str]:
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
+            return [origin.strip() for origin in v.split(",") if origin.strip()]
         return v
 
     class Config:
@@ -4,6 +4,7 @@ import logging
 import sys
 from typing import Any, Dict
 
+import orjson
 import structlog
 from rich.console import Console
 from rich.logging import RichHandler
@@ -13,35 +14,49 @@ from butler.core.config import settings
 
 def configure_logging() -> None:
     """Configure structured logging for the application."""
+    log_level = getattr(logging, settings.log_level.upper())
 
-    # Configure structlog
-    structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            (
-                structlog.processors.JSONRenderer()
-                if settings.log_format == "json"
-                else structlog.dev.ConsoleRenderer(colors=True)
-            ),
-        ],
-        context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
-        cache_logger_on_first_use=True,
-    )
+    if settings.log_format == "json":
+        # Render straight to stdout as orjson bytes, filtering by level inside
+        # structlog instead of dispatching every event through stdlib logging
+        structlog.configure(
+            processors=[
+                structlog.processors.add_log_level,
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.processors.StackInfoRenderer(),
+                structlog.processors.format_exc_info,
+                structlog.processors.UnicodeDecoder(),
+                structlog.processors.JSONRenderer(serializer=orjson.dumps),
+            ],
+            context_class=dict,
+            logger_factory=structlog.BytesLoggerFactory(),
+            wrapper_class=structlog.make_filtering_bound_logger(log_level),
+            cache_logger_on_first_use=True,
+        )
+    else:
+        structlog.configure(
+            processors=[
+                structlog.stdlib.filter_by_level,
+                structlog.stdlib.add_logger_name,
+                structlog.stdlib.add_log_level,
+                structlog.stdlib.PositionalArgumentsFormatter(),
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.processors.StackInfoRenderer(),
+                structlog.processors.format_exc_info,
+                structlog.processors.UnicodeDecoder(),
+                structlog.dev.ConsoleRenderer(colors=True),
+            ],
+            context_class=dict,
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            wrapper_class=structlog.stdlib.BoundLogger,
+            cache_logger_on_first_use=True,
+        )
 
     # Configure standard library logging
     if settings.log_format != "json":
         logging.basicConfig(
             format="%(message)s",
-            level=getattr(logging, settings.log_level.upper()),
+            level=log_level,
             handlers=[
                 RichHandler(
                     console=Console(stderr=True),
@@ -55,7 +70,7 @@ def configure_logging() -> None:
         logging.basicConfig(
             format="%(message)s",
             stream=sys.stdout,
-            level=getattr(logging, settings.log_level.upper()),
+            level=log_level,
         )
 
     # Set logging levels for third-party libraries
@@ -67,4 +82,8 @@ def configure_logging() -> None:
 
 def get_logger(name: str) -> structlog.BoundLogger:
     """Get a structured logger instance."""
-    return structlog.get_logger(name)
+    # Binding assembles the logger right away, so it must see the app's config
+    if not structlog.is_configured():
+        configure_logging()
+    # Bind the name explicitly since non-stdlib loggers do not carry one
+    return structlog.get_logger(name).bind(logger=name)
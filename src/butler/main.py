@@ -1,21 +1,30 @@
 """Main FastAPI application for Butler service."""
 
+import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
+from butler.api.endpoints.health import HEALTH_BODY
 from butler.api.routes import api_router
 from butler.core.config import settings
 from butler.core.logging import configure_logging, get_logger
+from butler.services.ai_service import get_ai_service
 
 # Configure logging
 configure_logging()
 logger = get_logger(__name__)
 
+# Settings read on request paths, bound once
+DEBUG = settings.debug
+
+# Health and probe endpoints polled by orchestrators are not request-logged
+UNLOGGED_PATH_PREFIXES = ("/health", "/api/v1/health")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -27,6 +36,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("Shutting down Butler service")
+    if get_ai_service.cache_info().currsize:
+        await get_ai_service().aclose()
+        # A later startup in the same process must not reuse the closed pool
+        get_ai_service.cache_clear()
 
 
 # Create FastAPI app
@@ -34,9 +47,10 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="A Python backend service",
-    docs_url="/docs" if settings.debug else None,
-    redoc_url="/redoc" if settings.debug else None,
+    docs_url="/docs" if DEBUG else None,
+    redoc_url="/redoc" if DEBUG else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add middleware
@@ -56,28 +70,26 @@ app.add_middleware(
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    """Log all HTTP requests."""
-    logger.info(
-        "HTTP request",
-        method=request.method,
-        url=str(request.url),
-        headers=dict(request.headers),
-    )
+    """Log all HTTP requests except health checks."""
+    if request.url.path.startswith(UNLOGGED_PATH_PREFIXES):
+        return await call_next(request)
 
+    start = time.perf_counter()
     response = await call_next(request)
 
     logger.info(
-        "HTTP response",
-        status_code=response.status_code,
+        "HTTP request",
         method=request.method,
-        url=str(request.url),
+        path=request.url.path,
+        status_code=response.status_code,
+        duration_ms=round((time.perf_counter() - start) * 1000, 2),
     )
 
     return response
 
 
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle global exceptions."""
     logger.error(
         "Unhandled exception",
@@ -86,8 +98,8 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
         url=str(request.url),
     )
 
-    if settings.debug:
-        return JSONResponse(
+    if DEBUG:
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Internal Server Error",
@@ -96,7 +108,7 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
             },
         )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"error": "Internal Server Error"},
     )
@@ -104,13 +116,9 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
 
 # Health check endpoint
 @app.get("/health")
-async def health_check():
+async def health_check() -> Response:
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": settings.app_name,
-        "version": settings.app_version,
-    }
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
 # Include API routes
@@ -1,37 +1,127 @@
 """AI service integration for multiple providers."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 
 import google.generativeai as genai
 import httpx
+import orjson
 from anthropic import AsyncAnthropic
 from openai import AsyncOpenAI
 
 from butler.core.config import settings
 from butler.core.logging import get_logger
+from butler.services.response_cache import ResponseCache
 
 logger = get_logger(__name__)
 
+# REST endpoints called directly on the chat hot path; the OpenAI one is
+# resolved against settings.openai_base_url
+OPENAI_CHAT_PATH = "/chat/completions"
+ANTHROPIC_MESSAGES_URL = "https://api.anthropic.com/v1/messages"
+ANTHROPIC_API_VERSION = "2023-06-01"
+
+# Connection pool shared by the provider clients
+HTTP_LIMITS = httpx.Limits(
+    max_connections=256, max_keepalive_connections=64, keepalive_expiry=30
+)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+@lru_cache(maxsize=64)
+def _google_generation_config(max_tokens: int, temperature: float) -> Any:
+    """Get a shared Google generation config for the given parameters."""
+    return genai.types.GenerationConfig(
+        max_output_tokens=max_tokens, temperature=temperature
+    )
+
 
 class AIService:
     """Service for interacting with multiple AI providers."""
 
-    def __init__(self):
+    DEFAULT_MODELS = {
+        "openai": "gpt-3.5-turbo",
+        "anthropic": "claude-3-sonnet-20240229",
+        "google": "gemini-pro",
+    }
+    DEFAULT_MAX_TOKENS = 1000
+    PROVIDER_LABELS = {
+        "openai": "OpenAI",
+        "anthropic": "Anthropic",
+        "google": "Google AI",
+    }
+
+    def __init__(self, response_cache: Optional[ResponseCache] = None):
+        self.response_cache = response_cache
         self.openai_client = None
         self.anthropic_client = None
         self.google_client = None
+        self._google_models: Dict[str, Any] = {}
+        self._inflight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+        # One keep-alive pool for all providers instead of one per SDK client
+        self.http_client = httpx.AsyncClient(
+            http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT
+        )
 
         # Initialize clients based on available API keys
         if settings.openai_api_key:
-            self.openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
+            self.openai_client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                base_url=settings.openai_base_url,
+                http_client=self.http_client,
+            )
+            self.openai_chat_url = (
+                settings.openai_base_url.rstrip("/") + OPENAI_CHAT_PATH
+            )
+            self._openai_template: Dict[str, Any] = {
+                "model": self.DEFAULT_MODELS["openai"],
+                "messages": [],
+                "max_tokens": self.DEFAULT_MAX_TOKENS,
+                "temperature": 0.7,
+            }
+            self.openai_headers = {
+                "Authorization": f"Bearer {settings.openai_api_key}",
+                "Content-Type": "application/json",
+            }
 
         if settings.anthropic_api_key:
-            self.anthropic_client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+            self.anthropic_client = AsyncAnthropic(
+                api_key=settings.anthropic_api_key, http_client=self.http_client
+            )
+            self.anthropic_headers = {
+                "x-api-key": settings.anthropic_api_key,
+                "anthropic-version": ANTHROPIC_API_VERSION,
+                "Content-Type": "application/json",
+            }
 
         if settings.google_ai_api_key:
             genai.configure(api_key=settings.google_ai_api_key)
             self.google_client = genai
 
+        self._dispatch = {
+            "openai": self._chat_openai,
+            "anthropic": self._chat_anthropic,
+            "google": self._chat_google,
+            "race": self._chat_race,
+        }
+        self._stream_dispatch = {
+            "openai": self._stream_openai,
+            "anthropic": self._stream_anthropic,
+            "google": self._stream_google,
+        }
+
+        # Client availability is fixed at construction, so the provider list
+        # is too; it is serialized once for the providers route
+        self.providers_body = orjson.dumps(
+            {"providers": self._build_providers_snapshot()}
+        )
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool."""
+        await self.http_client.aclose()
+
     async def chat(
         self,
         message: str,
@@ -40,16 +130,125 @@ class AIService:
         max_tokens: Optional[int] = None,
         temperature: float = 0.7,
     ) -> Dict[str, Any]:
-        """Send a chat message to the specified AI provider."""
-
-        if provider == "openai":
-            return await self._chat_openai(message, model, max_tokens, temperature)
-        elif provider == "anthropic":
-            return await self._chat_anthropic(message, model, max_tokens, temperature)
-        elif provider == "google":
-            return await self._chat_google(message, model, max_tokens, temperature)
-        else:
-            raise ValueError(f"Unsupported AI provider: {provider}")
+        """Send a chat message to the specified AI provider.
+
+        Identical requests are answered from the response cache, if configured,
+        and concurrent identical requests share a single provider call.
+        """
+        try:
+            handler = self._dispatch[provider]
+        except KeyError:
+            raise ValueError(f"Unsupported AI provider: {provider}") from None
+
+        key = ResponseCache.make_key(provider, model, max_tokens, temperature, message)
+        if self.response_cache is not None:
+            cached_response = self.response_cache.get(key)
+            if cached_response is not None:
+                return cached_response
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._call_provider(
+                    handler, key, message, model, max_tokens, temperature
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so one cancelled caller does not fail the others
+        return await asyncio.shield(task)
+
+    async def _call_provider(
+        self,
+        handler: Callable[..., Awaitable[Dict[str, Any]]],
+        key: str,
+        message: str,
+        model: Optional[str],
+        max_tokens: Optional[int],
+        temperature: float,
+    ) -> Dict[str, Any]:
+        """Call a provider handler and cache its response."""
+        response = await handler(message, model, max_tokens, temperature)
+
+        if self.response_cache is not None:
+            self.response_cache.set(key, response)
+
+        return response
+
+    def chat_stream(
+        self,
+        message: str,
+        provider: str = "openai",
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[str]:
+        """Stream a chat reply from the specified AI provider as text chunks.
+
+        The provider and its API key are validated before the stream is
+        returned, since the generator body only runs once iterated. Streamed
+        replies bypass the cache.
+        """
+        try:
+            handler = self._stream_dispatch[provider]
+        except KeyError:
+            raise ValueError(f"Unsupported AI provider: {provider}") from None
+
+        client = {
+            "openai": self.openai_client,
+            "anthropic": self.anthropic_client,
+            "google": self.google_client,
+        }[provider]
+        if not client:
+            raise ValueError(f"{self.PROVIDER_LABELS[provider]} API key not configured")
+
+        return handler(message, model, max_tokens, temperature)
+
+    async def _chat_race(
+        self,
+        message: str,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+    ) -> Dict[str, Any]:
+        """Chat with every configured provider and return the first success.
+
+        Each provider uses its default model, so ``model`` is ignored. Calls
+        still running once a response arrives are cancelled.
+        """
+        handlers = []
+        if self.openai_client:
+            handlers.append(self._chat_openai)
+        if self.anthropic_client:
+            handlers.append(self._chat_anthropic)
+        if self.google_client:
+            handlers.append(self._chat_google)
+
+        if not handlers:
+            raise ValueError("No AI provider configured")
+
+        pending = {
+            asyncio.create_task(handler(message, None, max_tokens, temperature))
+            for handler in handlers
+        }
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        # Every provider failed; surface the last error
+        assert error is not None
+        raise error
 
     async def _chat_openai(
         self,
@@ -62,25 +261,33 @@ class AIService:
         if not self.openai_client:
             raise ValueError("OpenAI API key not configured")
 
-        model = model or "gpt-3.5-turbo"
-        max_tokens = max_tokens or 1000
+        # Start from the default request and override only what differs
+        payload = self._openai_template.copy()
+        payload["messages"] = [{"role": "user", "content": message}]
+        if model is not None:
+            payload["model"] = model
+        if max_tokens is not None:
+            payload["max_tokens"] = max_tokens
+        payload["temperature"] = temperature
+        model = payload["model"]
 
         try:
-            response = await self.openai_client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": message}],
-                max_tokens=max_tokens,
-                temperature=temperature,
+            response = await self.http_client.post(
+                self.openai_chat_url,
+                headers=self.openai_headers,
+                content=orjson.dumps(payload),
             )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
 
             return {
-                "message": response.choices[0].message.content,
+                "message": data["choices"][0]["message"]["content"],
                 "provider": "openai",
                 "model": model,
                 "usage": {
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                    "total_tokens": response.usage.total_tokens,
+                    "prompt_tokens": data["usage"]["prompt_tokens"],
+                    "completion_tokens": data["usage"]["completion_tokens"],
+                    "total_tokens": data["usage"]["total_tokens"],
                 },
             }
         except Exception as e:
@@ -98,32 +305,50 @@ class AIService:
         if not self.anthropic_client:
             raise ValueError("Anthropic API key not configured")
 
-        model = model or "claude-3-sonnet-20240229"
-        max_tokens = max_tokens or 1000
+        if model is None:
+            model = self.DEFAULT_MODELS["anthropic"]
+        if max_tokens is None:
+            max_tokens = self.DEFAULT_MAX_TOKENS
 
         try:
-            response = await self.anthropic_client.messages.create(
-                model=model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                messages=[{"role": "user", "content": message}],
+            response = await self.http_client.post(
+                ANTHROPIC_MESSAGES_URL,
+                headers=self.anthropic_headers,
+                content=orjson.dumps(
+                    {
+                        "model": model,
+                        "max_tokens": max_tokens,
+                        "temperature": temperature,
+                        "messages": [{"role": "user", "content": message}],
+                    }
+                ),
             )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
 
             return {
-                "message": response.content[0].text,
+                "message": data["content"][0]["text"],
                 "provider": "anthropic",
                 "model": model,
                 "usage": {
-                    "prompt_tokens": response.usage.input_tokens,
-                    "completion_tokens": response.usage.output_tokens,
-                    "total_tokens": response.usage.input_tokens
-                    + response.usage.output_tokens,
+                    "prompt_tokens": data["usage"]["input_tokens"],
+                    "completion_tokens": data["usage"]["output_tokens"],
+                    "total_tokens": data["usage"]["input_tokens"]
+                    + data["usage"]["output_tokens"],
                 },
             }
         except Exception as e:
             logger.error("Anthropic API error", error=str(e))
             raise
 
+    def _google_model(self, model_name: str) -> Any:
+        """Get the cached Google model instance for a model name."""
+        model_instance = self._google_models.get(model_name)
+        if model_instance is None:
+            model_instance = genai.GenerativeModel(model_name)
+            self._google_models[model_name] = model_instance
+        return model_instance
+
     async def _chat_google(
         self,
         message: str,
@@ -135,37 +360,33 @@ class AIService:
         if not self.google_client:
             raise ValueError("Google AI API key not configured")
 
-        model_name = model or "gemini-pro"
+        model_name = model if model is not None else self.DEFAULT_MODELS["google"]
+        if max_tokens is None:
+            max_tokens = self.DEFAULT_MAX_TOKENS
 
         try:
-            model_instance = genai.GenerativeModel(model_name)
-            generation_config = genai.types.GenerationConfig(
-                max_output_tokens=max_tokens or 1000, temperature=temperature
-            )
+            model_instance = self._google_model(model_name)
+            generation_config = _google_generation_config(max_tokens, temperature)
 
             response = await model_instance.generate_content_async(
                 message, generation_config=generation_config
             )
 
+            usage_metadata = getattr(response, "usage_metadata", None)
+
             return {
                 "message": response.text,
                 "provider": "google",
                 "model": model_name,
                 "usage": {
                     "prompt_tokens": (
-                        response.usage_metadata.prompt_token_count
-                        if hasattr(response, 'usage_metadata')
-                        else 0
+                        usage_metadata.prompt_token_count if usage_metadata else 0
                     ),
                     "completion_tokens": (
-                        response.usage_metadata.candidates_token_count
-                        if hasattr(response, 'usage_metadata')
-                        else 0
+                        usage_metadata.candidates_token_count if usage_metadata else 0
                     ),
                     "total_tokens": (
-                        response.usage_metadata.total_token_count
-                        if hasattr(response, 'usage_metadata')
-                        else 0
+                        usage_metadata.total_token_count if usage_metadata else 0
                     ),
                 },
             }
@@ -173,8 +394,88 @@ class AIService:
             logger.error("Google AI API error", error=str(e))
             raise
 
-    async def get_available_providers(self) -> List[Dict[str, Any]]:
-        """Get list of available AI providers and their status."""
+    async def _stream_openai(
+        self,
+        message: str,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[str]:
+        """Stream a reply from OpenAI API."""
+        if model is None:
+            model = self.DEFAULT_MODELS["openai"]
+        if max_tokens is None:
+            max_tokens = self.DEFAULT_MAX_TOKENS
+
+        try:
+            stream = await self.openai_client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": message}],
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True,
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            logger.error("OpenAI API error", error=str(e))
+            raise
+
+    async def _stream_anthropic(
+        self,
+        message: str,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[str]:
+        """Stream a reply from Anthropic API."""
+        if model is None:
+            model = self.DEFAULT_MODELS["anthropic"]
+        if max_tokens is None:
+            max_tokens = self.DEFAULT_MAX_TOKENS
+
+        try:
+            async with self.anthropic_client.messages.stream(
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=[{"role": "user", "content": message}],
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        except Exception as e:
+            logger.error("Anthropic API error", error=str(e))
+            raise
+
+    async def _stream_google(
+        self,
+        message: str,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[str]:
+        """Stream a reply from Google Generative AI."""
+        model_name = model if model is not None else self.DEFAULT_MODELS["google"]
+        if max_tokens is None:
+            max_tokens = self.DEFAULT_MAX_TOKENS
+
+        try:
+            model_instance = self._google_model(model_name)
+            generation_config = _google_generation_config(max_tokens, temperature)
+
+            response = await model_instance.generate_content_async(
+                message, generation_config=generation_config, stream=True
+            )
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            logger.error("Google AI API error", error=str(e))
+            raise
+
+    def _build_providers_snapshot(self) -> List[Dict[str, Any]]:
+        """Build the provider status list from the configured clients."""
         providers = []
 
         if self.openai_client:
@@ -233,3 +534,13 @@ class AIService:
             )
 
         return providers
+
+
+@lru_cache()
+def get_ai_service() -> AIService:
+    """Get the shared AI service instance."""
+    response_cache = None
+    if settings.ai_response_cache_size > 0:
+        response_cache = ResponseCache(max_size=settings.ai_response_cache_size)
+
+    return AIService(response_cache=response_cache)
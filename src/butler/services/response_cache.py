@@ -0,0 +1,47 @@
+"""In-memory cache for AI chat responses."""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class ResponseCache:
+    """Bounded LRU cache of chat responses keyed by their request parameters."""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: Optional[str],
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        message: str,
+    ) -> str:
+        """Build a cache key from the parameters that determine a response."""
+        normalized = message.strip().lower()
+        if temperature is not None:
+            temperature_key = f"{temperature:.2f}"
+        else:
+            temperature_key = ""
+        raw_key = f"{provider}|{model}|{max_tokens}|{temperature_key}|{normalized}"
+        return hashlib.blake2b(raw_key.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached response, marking it as recently used."""
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+        return response
+
+    def set(self, key: str, response: Dict[str, Any]) -> None:
+        """Cache a response, evicting the least recently used one if full."""
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
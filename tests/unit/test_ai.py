@@ -1,10 +1,18 @@
 """Test AI service endpoints."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
+from butler.core.config import settings
+from butler.services.ai_service import AIService, get_ai_service
+from butler.services.response_cache import ResponseCache
+
 
 def get_auth_token(client: TestClient) -> str:
     """Helper function to get auth token."""
@@ -97,6 +105,54 @@ def test_chat_with_anthropic(mock_chat, client: TestClient):
     assert data["model"] == "claude-3-sonnet-20240229"
 
 
+@patch('butler.services.ai_service.AIService.chat_stream')
+def test_chat_stream(mock_chat_stream, client: TestClient):
+    """Test streaming a chat reply as server-sent events."""
+    token = get_auth_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async def chunks():
+        yield "Hello"
+        yield " there"
+
+    mock_chat_stream.return_value = chunks()
+
+    chat_data = {"message": "Hello, world!", "provider": "openai"}
+
+    response = client.post("/api/v1/ai/chat/stream", json=chat_data, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == (
+        'data: {"content":"Hello"}\n\n'
+        'data: {"content":" there"}\n\n'
+        "data: [DONE]\n\n"
+    )
+
+
+def test_chat_stream_invalid_provider(client: TestClient):
+    """Test streaming with an invalid provider is rejected before streaming."""
+    token = get_auth_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    chat_data = {"message": "Hello, world!", "provider": "invalid_provider"}
+
+    response = client.post("/api/v1/ai/chat/stream", json=chat_data, headers=headers)
+    assert response.status_code == 400
+
+
+def test_chat_stream_provider_not_configured(client: TestClient, monkeypatch):
+    """Test streaming from a provider without an API key is rejected up front."""
+    token = get_auth_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    monkeypatch.setattr(get_ai_service(), "openai_client", None)
+
+    chat_data = {"message": "Hello, world!", "provider": "openai"}
+
+    response = client.post("/api/v1/ai/chat/stream", json=chat_data, headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "OpenAI API key not configured"
+
+
 def test_chat_invalid_provider(client: TestClient):
     """Test chat with invalid provider."""
     token = get_auth_token(client)
@@ -108,6 +164,17 @@ def test_chat_invalid_provider(client: TestClient):
     assert response.status_code == 400
 
 
+def test_chat_unknown_field(client: TestClient):
+    """Test chat rejects fields the request model does not define."""
+    token = get_auth_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    chat_data = {"message": "Hello, world!", "provider": "openai", "top_k": 5}
+
+    response = client.post("/api/v1/ai/chat", json=chat_data, headers=headers)
+    assert response.status_code == 422
+
+
 def test_chat_missing_message(client: TestClient):
     """Test chat without message."""
     token = get_auth_token(client)
@@ -117,3 +184,172 @@ def test_chat_missing_message(client: TestClient):
 
     response = client.post("/api/v1/ai/chat", json=chat_data, headers=headers)
     assert response.status_code == 422  # Validation error
+
+
+@pytest.mark.asyncio
+async def test_chat_response_cache():
+    """Test identical chat requests are served from the response cache."""
+    ai_service = AIService(response_cache=ResponseCache(max_size=1))
+    chat_openai = AsyncMock(
+        return_value={
+            "message": "Hi!",
+            "provider": "openai",
+            "model": "gpt-3.5-turbo",
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
+    )
+    ai_service._dispatch["openai"] = chat_openai
+
+    first = await ai_service.chat("Hello", provider="openai")
+    second = await ai_service.chat("  hello ", provider="openai")
+    assert second == first
+    chat_openai.assert_awaited_once()
+
+    # Evicted once another request takes the only slot
+    await ai_service.chat("Something else", provider="openai")
+    await ai_service.chat("Hello", provider="openai")
+    assert chat_openai.await_count == 3
+
+
+def test_response_cache_key():
+    """Test cache keys are compact and ignore insignificant differences."""
+    key = ResponseCache.make_key("openai", None, None, 0.7, "Hello")
+
+    assert len(key) == 32
+    assert key == ResponseCache.make_key("openai", None, None, 0.7000001, " hello")
+    assert key != ResponseCache.make_key("openai", None, None, 0.8, "Hello")
+    assert key != ResponseCache.make_key("anthropic", None, None, 0.7, "Hello")
+
+
+@pytest.mark.asyncio
+async def test_chat_openai_rest_call(monkeypatch):
+    """Test OpenAI chat requests are sent directly to the REST endpoint."""
+    monkeypatch.setattr(settings, "openai_api_key", "test-key")
+    monkeypatch.setattr(settings, "openai_base_url", "http://vllm.local:8000/v1/")
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "choices": [{"message": {"content": "Hi!"}}],
+                "usage": {
+                    "prompt_tokens": 3,
+                    "completion_tokens": 2,
+                    "total_tokens": 5,
+                },
+            },
+        )
+
+    ai_service = AIService()
+    await ai_service.aclose()
+    ai_service.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    response = await ai_service.chat("Hello", provider="openai", max_tokens=50)
+    await ai_service.aclose()
+
+    assert response == {
+        "message": "Hi!",
+        "provider": "openai",
+        "model": "gpt-3.5-turbo",
+        "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+    }
+    assert str(requests[0].url) == "http://vllm.local:8000/v1/chat/completions"
+    assert requests[0].headers["Authorization"] == "Bearer test-key"
+    assert requests[0].headers["Content-Type"] == "application/json"
+    assert json.loads(requests[0].content)["max_tokens"] == 50
+
+
+@pytest.mark.asyncio
+async def test_chat_race_returns_first_success():
+    """Test racing providers returns the fastest successful response."""
+    ai_service = AIService()
+    ai_service.openai_client = object()
+    ai_service.anthropic_client = object()
+
+    # OpenAI only answers once released, so it loses the first race
+    release_openai = asyncio.Event()
+
+    async def slow_openai(*args):
+        await release_openai.wait()
+        return {"provider": "openai"}
+
+    ai_service._chat_openai = slow_openai
+    ai_service._chat_anthropic = AsyncMock(return_value={"provider": "anthropic"})
+
+    response = await ai_service.chat("Hello", provider="race")
+    assert response == {"provider": "anthropic"}
+
+    # A failing provider does not win the race
+    release_openai.set()
+    ai_service._chat_anthropic = AsyncMock(side_effect=RuntimeError("down"))
+    response = await ai_service.chat("Hello again", provider="race")
+    assert response == {"provider": "openai"}
+
+    await ai_service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_available_providers_body():
+    """Test provider status is serialized once at service init."""
+    ai_service = AIService()
+
+    providers = orjson.loads(ai_service.providers_body)["providers"]
+    assert [provider["name"] for provider in providers] == [
+        "openai",
+        "anthropic",
+        "google",
+    ]
+
+    await ai_service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_chat_google_reuses_model():
+    """Test Google model instances are cached per model name."""
+    ai_service = AIService()
+    ai_service.google_client = object()
+
+    with patch("butler.services.ai_service.genai") as mock_genai:
+        model_instance = MagicMock()
+        model_instance.generate_content_async = AsyncMock(
+            return_value=MagicMock(text="Hi")
+        )
+        mock_genai.GenerativeModel.return_value = model_instance
+
+        await ai_service._chat_google("Hello")
+        await ai_service._chat_google("Hello again")
+
+        mock_genai.GenerativeModel.assert_called_once_with("gemini-pro")
+        assert model_instance.generate_content_async.await_count == 2
+
+    await ai_service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_chat_coalesces_concurrent_requests():
+    """Test concurrent identical requests share a single provider call."""
+    ai_service = AIService()
+    calls = 0
+
+    async def chat_openai(*args):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"provider": "openai"}
+
+    ai_service._dispatch["openai"] = chat_openai
+
+    responses = await asyncio.gather(
+        *(ai_service.chat("Hello", provider="openai") for _ in range(5))
+    )
+    assert responses == [{"provider": "openai"}] * 5
+    assert calls == 1
+    assert not ai_service._inflight
+
+    # Once the call finishes, the next request goes to the provider again
+    await ai_service.chat("Hello", provider="openai")
+    assert calls == 2
+
+    await ai_service.aclose()
@@ -3,6 +3,9 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from butler.api.endpoints import auth
+from butler.core.config import settings
+
 
 def test_register_user(client: TestClient, sample_user_data):
     """Test user registration."""
@@ -15,6 +18,13 @@ def test_register_user(client: TestClient, sample_user_data):
     assert "expires_in" in data
 
 
+def test_register_invalid_email(client: TestClient, sample_user_data):
+    """Test registration rejects malformed emails."""
+    user_data = {**sample_user_data, "email": "not-an-email"}
+    response = client.post("/api/v1/auth/register", json=user_data)
+    assert response.status_code == 422
+
+
 def test_login_user(client: TestClient, sample_user_data):
     """Test user login."""
     login_data = {
@@ -76,3 +86,30 @@ def test_refresh_token(client: TestClient, sample_user_data):
     assert "access_token" in data
     assert data["token_type"] == "bearer"
     assert "expires_in" in data
+
+
+def test_password_hash_cache(monkeypatch):
+    """Test repeated passwords reuse their hash only when caching is enabled."""
+    assert auth.get_password_hash("secret") != auth.get_password_hash("secret")
+
+    monkeypatch.setattr(settings, "cache_password_hashes", True)
+    monkeypatch.setattr(auth, "_password_hash_cache", {})
+
+    hashed_password = auth.get_password_hash("secret")
+    assert auth.get_password_hash("secret") == hashed_password
+    assert auth.verify_password("secret", hashed_password)
+
+
+def test_decode_access_token_cache(monkeypatch):
+    """Test decoded tokens are cached until they expire."""
+    monkeypatch.setattr(auth, "_token_cache", {})
+
+    token = auth.create_access_token(data={"sub": "test@example.com"})
+    payload = auth.decode_access_token(token)
+    assert payload["sub"] == "test@example.com"
+    assert auth.decode_access_token(token) is payload
+
+    # An expired cache entry falls through to a full decode
+    key = next(iter(auth._token_cache))
+    auth._token_cache[key] = (0.0, {"sub": "stale@example.com"})
+    assert auth.decode_access_token(token)["sub"] == "test@example.com"